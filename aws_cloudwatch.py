@@ -71,7 +71,7 @@ class CloudWatchManager:
             return {
                 'label': response.get('Label', metric_name),
                 'datapoints': [{
-                    'timestamp': dp['Timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
+                    'timestamp': dp['Timestamp'].isoformat(sep=' ', timespec='seconds'),
                     'average': dp.get('Average', 0),
                     'sum': dp.get('Sum', 0),
                     'minimum': dp.get('Minimum', 0),
@@ -113,17 +113,22 @@ class CloudWatchManager:
     
     # ============= ALARMS =============
     
-    def list_alarms(self, state_value: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List CloudWatch alarms"""
+    def list_alarms(self, state_value: Optional[str] = None,
+                   alarm_name_prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List CloudWatch alarms, filtered server-side where possible"""
         try:
+            # Both filters are applied by the DescribeAlarms API itself so
+            # large accounts only transfer the alarms that match.
             params = {}
             if state_value:
                 params['StateValue'] = state_value
-            
+            if alarm_name_prefix:
+                params['AlarmNamePrefix'] = alarm_name_prefix
+
             alarms = []
             paginator = self.cloudwatch.get_paginator('describe_alarms')
-            
-            for page in paginator.paginate(**params):
+
+            for page in paginator.paginate(PaginationConfig={'PageSize': 100}, **params):
                 for alarm in page['MetricAlarms']:
                     alarms.append({
                         'alarm_name': alarm['AlarmName'],
@@ -222,7 +227,7 @@ class CloudWatchManager:
                     log_groups.append({
                         'log_group_name': lg['logGroupName'],
                         'arn': lg.get('arn', ''),
-                        'creation_time': datetime.fromtimestamp(lg['creationTime']/1000).strftime('%Y-%m-%d %H:%M:%S'),
+                        'creation_time': datetime.fromtimestamp(lg['creationTime']/1000).isoformat(sep=' ', timespec='seconds'),
                         'retention_days': lg.get('retentionInDays', 'Never expire'),
                         'stored_bytes': lg.get('storedBytes', 0),
                         'metric_filter_count': lg.get('metricFilterCount', 0)
@@ -277,8 +282,8 @@ class CloudWatchManager:
             for stream in response.get('logStreams', []):
                 streams.append({
                     'log_stream_name': stream['logStreamName'],
-                    'creation_time': datetime.fromtimestamp(stream['creationTime']/1000).strftime('%Y-%m-%d %H:%M:%S'),
-                    'last_event_time': datetime.fromtimestamp(stream.get('lastEventTimestamp', stream['creationTime'])/1000).strftime('%Y-%m-%d %H:%M:%S'),
+                    'creation_time': datetime.fromtimestamp(stream['creationTime']/1000).isoformat(sep=' ', timespec='seconds'),
+                    'last_event_time': datetime.fromtimestamp(stream.get('lastEventTimestamp', stream['creationTime'])/1000).isoformat(sep=' ', timespec='seconds'),
                     'stored_bytes': stream.get('storedBytes', 0)
                 })
             
@@ -307,7 +312,7 @@ class CloudWatchManager:
             events = []
             for event in response.get('events', []):
                 events.append({
-                    'timestamp': datetime.fromtimestamp(event['timestamp']/1000).strftime('%Y-%m-%d %H:%M:%S'),
+                    'timestamp': datetime.fromtimestamp(event['timestamp']/1000).isoformat(sep=' ', timespec='seconds'),
                     'message': event['message']
                 })
             
@@ -315,7 +320,50 @@ class CloudWatchManager:
         except Exception as e:
             st.error(f"Error getting log events: {str(e)}")
             return []
-    
+
+    def get_log_events_paginated(self, log_group_name: str, log_stream_name: str,
+                                page_size: int = 10, limit: int = 100):
+        """Yield the most recent log events one page at a time, newest page first
+
+        Pages backwards from the stream tail with nextBackwardToken, so
+        callers get the same tail window get_log_events(limit=N) returns
+        while still being able to render each page as it arrives. Events
+        within a page stay in chronological order.
+        """
+        try:
+            params = {
+                'logGroupName': log_group_name,
+                'logStreamName': log_stream_name,
+                'limit': page_size,
+                'startFromHead': False
+            }
+
+            fetched = 0
+            prev_token = None
+            while fetched < limit:
+                response = self.logs.get_log_events(**params)
+
+                events = [
+                    {
+                        'timestamp': datetime.fromtimestamp(event['timestamp']/1000).isoformat(sep=' ', timespec='seconds'),
+                        'message': event['message']
+                    }
+                    for event in response.get('events', [])
+                ]
+                if events:
+                    fetched += len(events)
+                    yield events
+
+                # The backward token repeating means the stream head was
+                # reached; without the check this would loop forever.
+                token = response.get('nextBackwardToken')
+                if not events or not token or token == prev_token:
+                    break
+                prev_token = token
+                params['nextToken'] = token
+        except Exception as e:
+            st.error(f"Error getting log events: {str(e)}")
+
     def filter_log_events(self, log_group_name: str, filter_pattern: str,
                          start_time: Optional[datetime] = None,
                          end_time: Optional[datetime] = None,
@@ -338,7 +386,7 @@ class CloudWatchManager:
             events = []
             for event in response.get('events', []):
                 events.append({
-                    'timestamp': datetime.fromtimestamp(event['timestamp']/1000).strftime('%Y-%m-%d %H:%M:%S'),
+                    'timestamp': datetime.fromtimestamp(event['timestamp']/1000).isoformat(sep=' ', timespec='seconds'),
                     'log_stream_name': event['logStreamName'],
                     'message': event['message']
                 })
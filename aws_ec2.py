@@ -6,16 +6,26 @@ import streamlit as st
 from typing import List, Dict, Optional
 from datetime import datetime
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Pool sized for the thread-pool fan-outs that share these clients (the
+# urllib3 default of 10 serializes concurrent describes), with adaptive
+# retries for throttling and keepalive for sparse interactive use.
+_BOTO_CFG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
 class EC2Service:
     """EC2 operations across accounts and regions"""
-    
+
     def __init__(self, session: boto3.Session, region: str = 'us-east-1'):
         """Initialize EC2 service"""
         self.session = session
         self.region = region
-        self.client = session.client('ec2', region_name=region)
+        self.client = session.client('ec2', region_name=region, config=_BOTO_CFG)
     
     def list_instances(_self, filters: Optional[List[Dict]] = None) -> Dict:
         """
@@ -32,6 +42,7 @@ class EC2Service:
             instances = []
             paginator = _self.client.get_paginator('describe_instances')
             
+            params['PaginationConfig'] = {'PageSize': 1000}
             for page in paginator.paginate(**params):
                 for reservation in page['Reservations']:
                     for instance in reservation['Instances']:
@@ -120,6 +131,28 @@ class EC2Service:
         except ClientError:
             return False
     
+    def start_instances(self, instance_ids: List[str]) -> bool:
+        """Start multiple EC2 instances in batched API calls"""
+        return self._batch_call('start_instances', instance_ids)
+
+    def stop_instances(self, instance_ids: List[str]) -> bool:
+        """Stop multiple EC2 instances in batched API calls"""
+        return self._batch_call('stop_instances', instance_ids)
+
+    def reboot_instances(self, instance_ids: List[str]) -> bool:
+        """Reboot multiple EC2 instances in batched API calls"""
+        return self._batch_call('reboot_instances', instance_ids)
+
+    def _batch_call(self, operation: str, instance_ids: List[str]) -> bool:
+        """Issue one API call per 1000 instance IDs (the EC2 batch limit)"""
+        try:
+            method = getattr(self.client, operation)
+            for start in range(0, len(instance_ids), 1000):
+                method(InstanceIds=instance_ids[start:start + 1000])
+            return True
+        except ClientError:
+            return False
+
     def add_tags(self, instance_id: str, tags: Dict[str, str]) -> bool:
         """Add tags to an instance"""
         try:
@@ -135,8 +168,13 @@ class EC2Service:
     def get_instance_types(_self) -> List[str]:
         """Get list of available instance types"""
         try:
-            response = _self.client.describe_instance_types()
-            return sorted([it['InstanceType'] for it in response['InstanceTypes']])
+            # describe_instance_types truncates at one page (~100 types);
+            # paginate so the full catalog comes back.
+            instance_types = []
+            paginator = _self.client.get_paginator('describe_instance_types')
+            for page in paginator.paginate():
+                instance_types.extend(it['InstanceType'] for it in page['InstanceTypes'])
+            return sorted(instance_types)
         except ClientError:
             return []
     
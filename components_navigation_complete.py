@@ -4,8 +4,6 @@ Main Navigation Component - FIXED for Unified Security Module
 
 import streamlit as st
 from core_session_manager import SessionManager
-from modules_account_management import AccountManagementModule  # AWS connection management
-from modules_account_lifecycle import AccountLifecycleModule
 
 class Navigation:
     """Main application navigation"""
@@ -5,6 +5,7 @@ Complete account lifecycle management UI
 
 import streamlit as st
 import pandas as pd
+from collections import Counter
 from typing import Dict, List, Optional
 from datetime import datetime
 from config_settings import AppConfig
@@ -67,8 +68,10 @@ class AccountManagementModule:
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
         
-        active_count = len([a for a in accounts if a.status == 'active'])
-        suspended_count = len([a for a in accounts if a.status == 'suspended'])
+        # One pass over the account list covers both status counts.
+        status_counts = Counter(a.status for a in accounts)
+        active_count = status_counts['active']
+        suspended_count = status_counts['suspended']
         
         with col1:
             st.metric("Total Accounts", len(accounts))
@@ -82,57 +85,76 @@ class AccountManagementModule:
         
         st.markdown("---")
         
-        # Account cards
-        for idx, acc in enumerate(accounts):
-            with st.expander(
-                f"{'✅' if acc.status == 'active' else '❌'} **{acc.account_name}** ({acc.account_id})",
-                expanded=False
-            ):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown(f"""
-                    **Account Details:**
-                    - **Account ID:** `{acc.account_id}`
-                    - **Environment:** {Helpers.get_environment_badge(acc.environment)}
-                    - **Status:** {acc.status.upper()}
-                    - **Cost Center:** {acc.cost_center or 'Not set'}
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown(f"""
-                    **Configuration:**
-                    - **Role ARN:** `{acc.role_arn}`
-                    - **Regions:** {', '.join(acc.regions)}
-                    - **Owner:** {acc.owner_email or 'Not set'}
-                    """)
-                
-                # Test connection, resources, costs, and DELETE buttons
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    if st.button("🔄 Test Connection", key=f"test_{acc.account_name}_{acc.account_id}_{idx}"):
-                        with st.spinner("Testing connection..."):
-                            success, error = account_mgr.test_account_connection(
-                                acc.account_id,
-                                acc.account_name,
-                                acc.role_arn
-                            )
-                            if success:
-                                st.success("✅ Connection successful!")
-                            else:
-                                st.error(f"❌ Connection failed: {error}")
-                
-                with col2:
-                    if st.button("📊 View Resources", key=f"resources_{acc.account_name}_{acc.account_id}_{idx}"):
-                        st.info("Navigate to Resource Inventory tab")
-                
-                with col3:
-                    if st.button("💰 View Costs", key=f"costs_{acc.account_name}_{acc.account_id}_{idx}"):
-                        st.info("Navigate to FinOps tab")
-                
-                with col4:
-                    if st.button("🗑️ Delete", key=f"delete_{acc.account_name}_{acc.account_id}_{idx}", type="secondary"):
-                        AccountManagementModule._show_delete_instructions(acc)
+        # One virtualized table replaces an expander (and four buttons) per
+        # account, so widget count stays O(1) as accounts are added.
+        accounts_df = pd.DataFrame([{
+            'Status': '✅' if acc.status == 'active' else '❌',
+            'Account Name': acc.account_name,
+            'Account ID': acc.account_id,
+            'Environment': acc.environment,
+            'Regions': ', '.join(acc.regions),
+            'Owner': acc.owner_email or 'Not set'
+        } for acc in accounts])
+
+        selection = st.dataframe(
+            accounts_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="account_overview_table"
+        )
+
+        # Details and actions only exist for the one selected account.
+        if selection.selection.rows:
+            acc = accounts[selection.selection.rows[0]]
+
+            st.markdown(f"#### {acc.account_name} ({acc.account_id})")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown(f"""
+                **Account Details:**
+                - **Account ID:** `{acc.account_id}`
+                - **Environment:** {Helpers.get_environment_badge(acc.environment)}
+                - **Status:** {acc.status.upper()}
+                - **Cost Center:** {acc.cost_center or 'Not set'}
+                """, unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(f"""
+                **Configuration:**
+                - **Role ARN:** `{acc.role_arn}`
+                - **Regions:** {', '.join(acc.regions)}
+                - **Owner:** {acc.owner_email or 'Not set'}
+                """)
+
+            # Test connection, resources, costs, and DELETE buttons
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                if st.button("🔄 Test Connection", key="account_test_connection"):
+                    with st.spinner("Testing connection..."):
+                        success, error = account_mgr.test_account_connection(
+                            acc.account_id,
+                            acc.account_name,
+                            acc.role_arn
+                        )
+                        if success:
+                            st.success("✅ Connection successful!")
+                        else:
+                            st.error(f"❌ Connection failed: {error}")
+
+            with col2:
+                if st.button("📊 View Resources", key="account_view_resources"):
+                    st.info("Navigate to Resource Inventory tab")
+
+            with col3:
+                if st.button("💰 View Costs", key="account_view_costs"):
+                    st.info("Navigate to FinOps tab")
+
+            with col4:
+                if st.button("🗑️ Delete", key="account_delete", type="secondary"):
+                    AccountManagementModule._show_delete_instructions(acc)
     
     @staticmethod
     def _show_delete_instructions(account):
@@ -4,7 +4,6 @@ Design & Planning, Provisioning, Operations, Security & Compliance
 """
 
 import streamlit as st
-import pandas as pd
 from config_settings import AppConfig
 from core_account_manager import get_account_manager
 
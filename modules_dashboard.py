@@ -5,6 +5,7 @@ Enterprise overview of multi-account AWS environment with AWS theming
 
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from datetime import datetime, timedelta
 from config_settings import AppConfig
@@ -76,9 +77,10 @@ class DashboardModule:
             )
         
         with col2:
-            # Count total resources across accounts
-            total_resources = 0
-            for acc in active_accounts[:3]:  # Sample first 3 for performance
+            # Count total resources across accounts. The per-account calls
+            # are independent blocking I/O, so run them concurrently and
+            # pay roughly one round trip instead of one per account.
+            def count_instances(acc):
                 try:
                     session = account_mgr.assume_role(
                         acc.account_id,
@@ -88,11 +90,15 @@ class DashboardModule:
                     if session:
                         from aws_ec2 import EC2Service
                         ec2 = EC2Service(session.session, acc.regions[0])
-                        result = ec2.list_instances()
-                        total_resources += result.get('count', 0)
+                        return ec2.list_instances().get('count', 0)
                 except:
                     pass
-            
+                return 0
+
+            sampled = active_accounts[:3]  # Sample first 3 for performance
+            with ThreadPoolExecutor(max_workers=len(sampled)) as executor:
+                total_resources = sum(executor.map(count_instances, sampled))
+
             AWSTheme.aws_metric_card(
                 label="Total Resources",
                 value=Helpers.format_number(total_resources) if total_resources > 0 else "N/A",
@@ -176,16 +182,21 @@ class DashboardModule:
         
         st.markdown("### 🏢 Account Status")
         
-        table_data = []
-        
-        for acc in active_accounts:
-            # Test connection
-            success, error = account_mgr.test_account_connection(
+        # Connection tests are independent STS round trips; run them
+        # concurrently so the table loads in ~one round trip.
+        def test_connection(acc):
+            return account_mgr.test_account_connection(
                 acc.account_id,
                 acc.account_name,
                 acc.role_arn
             )
-            
+
+        with ThreadPoolExecutor(max_workers=min(16, len(active_accounts))) as executor:
+            results = list(executor.map(test_connection, active_accounts))
+
+        table_data = []
+
+        for acc, (success, error) in zip(active_accounts, results):
             table_data.append({
                 'Account Name': acc.account_name,
                 'Account ID': acc.account_id,
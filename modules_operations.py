@@ -5,218 +5,205 @@ Leveraging Anthropic Claude for intelligent operations, troubleshooting, and aut
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from botocore.config import Config
 from core_account_manager import get_account_manager, get_account_names
 import json
+import threading
+
+# ============================================================================
+# MODULE CONSTANTS
+# ============================================================================
+
+# Static lookups and literals hoisted out of the render paths so reruns
+# don't re-allocate them.
+
+_STATUS_ICON = {
+    'running': '🟢',
+    'stopped': '🔴',
+    'pending': '🟡',
+    'stopping': '🟡',
+    'shutting-down': '🟡',
+    'terminated': '⚫'
+}
+
+_SAMPLE_QUESTIONS = (
+    "Show me all running EC2 instances and their costs",
+    "What's consuming the most resources in my account?",
+    "How can I reduce my AWS bill this month?",
+    "Find instances that haven't been used in 7 days",
+    "What security issues should I address first?",
+    "Create a disaster recovery plan for my critical resources"
+)
+
+_RECENT_ISSUES_DF = pd.DataFrame([
+    {
+        'Time': '2 hours ago',
+        'Issue': 'High memory usage on prod-web-server-01',
+        'Root Cause': 'Memory leak in Node.js application',
+        'Resolution': 'Restarted application + deployed memory leak fix',
+        'Time to Resolve': '8 minutes'
+    },
+    {
+        'Time': '5 hours ago',
+        'Issue': 'Lambda function timeouts',
+        'Root Cause': 'Insufficient memory allocation (128 MB)',
+        'Resolution': 'Increased memory to 512 MB',
+        'Time to Resolve': '3 minutes'
+    },
+    {
+        'Time': '1 day ago',
+        'Issue': 'S3 bucket access denied errors',
+        'Root Cause': 'Incorrect bucket policy after update',
+        'Resolution': 'Restored previous bucket policy',
+        'Time to Resolve': '5 minutes'
+    }
+])
+
+_SAMPLE_DEPLOYMENTS_DF = pd.DataFrame([
+    {
+        'Model Name': 'fraud-detection-v2',
+        'Type': 'SageMaker',
+        'Status': 'InService',
+        'Requests/min': '450',
+        'Latency (p99)': '85ms',
+        'Accuracy': '94.2%',
+        'Cost/day': '$3.60'
+    },
+    {
+        'Model Name': 'recommendation-engine',
+        'Type': 'Lambda',
+        'Status': 'Active',
+        'Requests/min': '1200',
+        'Latency (p99)': '120ms',
+        'Accuracy': '89.5%',
+        'Cost/day': '$1.20'
+    },
+    {
+        'Model Name': 'claude-summarizer',
+        'Type': 'Bedrock',
+        'Status': 'Active',
+        'Requests/min': '80',
+        'Latency (p99)': '2.3s',
+        'Accuracy': 'N/A',
+        'Cost/day': '$12.40'
+    }
+])
+
+_SAMPLE_PREDICTIONS = (
+    {
+        'Resource': 'prod-db-master',
+        'Issue': 'Disk space exhaustion',
+        'Probability': '87%',
+        'ETA': '36 hours',
+        'Severity': 'Critical',
+        'Recommendation': 'Increase volume size from 100GB to 200GB',
+        'Prevention Cost': '$5/month',
+        'Outage Cost': '$10,000'
+    },
+    {
+        'Resource': 'prod-cache',
+        'Issue': 'Memory limit reached',
+        'Probability': '72%',
+        'ETA': '48 hours',
+        'Severity': 'High',
+        'Recommendation': 'Upgrade from cache.t3.medium to cache.r5.large',
+        'Prevention Cost': '$45/month',
+        'Outage Cost': '$5,000'
+    },
+    {
+        'Resource': 'api-gateway',
+        'Issue': 'Rate limit exceeded',
+        'Probability': '65%',
+        'ETA': '24 hours',
+        'Severity': 'Medium',
+        'Recommendation': 'Increase throttle limits',
+        'Prevention Cost': '$0',
+        'Outage Cost': '$2,000'
+    }
+)
+
+_SEVERITY_COLOR = {
+    'Critical': '#dc3545',
+    'High': '#fd7e14',
+    'Medium': '#ffc107'
+}
+
+# One template formatted per prediction and emitted as a single
+# st.markdown call, instead of eight separate markdown widgets per row.
+_PREDICTION_TMPL = """
+**Severity:** <span style='color: {severity_color}; font-weight: bold;'>{severity}</span><br/>
+**Probability:** {probability}<br/>
+**Estimated Time:** {eta}<br/>
+**Recommendation:** {recommendation}
+
+---
+**Cost Analysis:**
+- Prevention: {prevention_cost}
+- Potential outage: {outage_cost}
+- **ROI:** {roi}%
+"""
 
-class OperationsModule:
-    """AI-Enhanced Operations with Anthropic Claude"""
-    
-    @staticmethod
-    def render():
-        """Main render method"""
-        st.title("⚙️ AI-Enhanced Operations")
-        st.markdown("**Intelligent Operations powered by Anthropic Claude** - AI assistant, predictive maintenance, smart automation, and comprehensive vulnerability management")
-        
-        account_mgr = get_account_manager()
-        if not account_mgr:
-            st.warning("⚠️ Configure AWS credentials first")
-            return
-        
-        account_names = get_account_names()
-        if not account_names:
-            st.warning("⚠️ No AWS accounts configured")
-            return
-        
-        # Account selection
-        selected_account = st.selectbox(
-            "Select AWS Account",
-            options=account_names,
-            key="operations_account"
-        )
-        
-        if not selected_account:
-            return
-        
-        # Get region
-        selected_region = st.session_state.get('selected_regions', 'all')
-        
-        if selected_region == 'all':
-            st.error("❌ Operations require a specific region. Please select a region from the sidebar.")
-            return
-        
-        st.info(f"📍 Managing operations in **{selected_region}**")
-        
-        # Get session
-        session = account_mgr.get_session_with_region(selected_account, selected_region)
-        if not session:
-            st.error(f"Failed to get session for {selected_account} in {selected_region}")
-            return
-        
-        # Create tabs with AI features + Vulnerability Management
-        tabs = st.tabs([
-            "🤖 AI Operations Assistant",
-            "🔍 AI Troubleshooting",
-            "🛡️ Vulnerability Management",
-            "💻 Instance Management",
-            "📊 ML Model Deployment",
-            "🔮 Predictive Maintenance",
-            "📖 Smart Runbooks"
-        ])
-        
-        with tabs[0]:
-            OperationsModule._render_ai_assistant(session, selected_region, selected_account)
-        
-        with tabs[1]:
-            OperationsModule._render_ai_troubleshooting(session, selected_region)
-        
-        with tabs[2]:
-            # Vulnerability Management
-            try:
-                from modules_vulnerability_management import VulnerabilityManagementModule
-                VulnerabilityManagementModule.render(session, selected_region)
-            except ImportError as e:
-                st.error(f"❌ Vulnerability Management module not found: {e}")
-                st.info("Please ensure modules_vulnerability_management.py is in the src folder.")
-        
-        with tabs[3]:
-            OperationsModule._render_instance_management(session, selected_region)
-        
-        with tabs[4]:
-            OperationsModule._render_ml_deployment(session, selected_region)
-        
-        with tabs[5]:
-            OperationsModule._render_predictive_maintenance(session, selected_region)
-        
-        with tabs[6]:
-            OperationsModule._render_smart_runbooks(session, selected_region)
-    
-    @staticmethod
-    def _render_ai_assistant(session, region, account):
-        """AI Operations Assistant powered by Claude"""
-        st.markdown("## 🤖 AI Operations Assistant")
-        st.info("💬 Chat with Claude about your AWS infrastructure - ask questions, get recommendations, automate operations")
-        
-        # Initialize chat history
-        if 'ops_chat_history' not in st.session_state:
-            st.session_state.ops_chat_history = []
-        
-        # Sample questions
-        st.markdown("### 💡 Try asking:")
-        
-        sample_questions = [
-            "Show me all running EC2 instances and their costs",
-            "What's consuming the most resources in my account?",
-            "How can I reduce my AWS bill this month?",
-            "Find instances that haven't been used in 7 days",
-            "What security issues should I address first?",
-            "Create a disaster recovery plan for my critical resources"
-        ]
-        
-        cols = st.columns(2)
-        for i, question in enumerate(sample_questions):
-            with cols[i % 2]:
-                if st.button(f"💡 {question}", key=f"sample_ops_q_{i}", use_container_width=True):
-                    st.session_state.ops_query = question
-        
-        st.markdown("---")
-        
-        # Chat interface
-        query = st.text_area(
-            "Ask Claude about your AWS operations:",
-            value=st.session_state.get('ops_query', ''),
-            placeholder="e.g., Stop all instances tagged Environment=Dev",
-            height=100,
-            key="ops_query_input"
-        )
-        
-        col1, col2, col3 = st.columns([1, 1, 4])
-        
-        with col1:
-            ask_button = st.button("🤖 Ask Claude", type="primary", key="ops_ask_claude", use_container_width=True)
-        
-        with col2:
-            if st.button("🗑️ Clear Chat", key="ops_clear_chat", use_container_width=True):
-                st.session_state.ops_chat_history = []
-                st.session_state.ops_query = ''
-                st.rerun()
-        
-        if ask_button and query:
-            # Add user message to history
-            st.session_state.ops_chat_history.append({
-                'role': 'user',
-                'content': query,
-                'timestamp': datetime.now()
-            })
-            
-            with st.spinner("🤖 Claude is analyzing your infrastructure..."):
-                import time
-                time.sleep(1.5)
-                
-                # Generate intelligent response based on query
-                response = OperationsModule._generate_ai_response(query, session, region, account)
-                
-                # Add assistant response to history
-                st.session_state.ops_chat_history.append({
-                    'role': 'assistant',
-                    'content': response,
-                    'timestamp': datetime.now()
-                })
-        
-        # Display chat history
-        if st.session_state.ops_chat_history:
-            st.markdown("---")
-            st.markdown("### 💬 Conversation")
-            
-            for msg in st.session_state.ops_chat_history:
-                if msg['role'] == 'user':
-                    st.markdown(f"""
-                    <div style="background: #e3f2fd; padding: 15px; border-radius: 10px; margin: 10px 0;">
-                        <strong>👤 You:</strong><br/>
-                        {msg['content']}
-                        <br/><small style="color: #666;">{msg['timestamp'].strftime('%H:%M:%S')}</small>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div style="background: #f5f5f5; padding: 15px; border-radius: 10px; margin: 10px 0;">
-                        <strong>🤖 Claude:</strong><br/>
-                        {msg['content']}
-                        <br/><small style="color: #666;">{msg['timestamp'].strftime('%H:%M:%S')}</small>
-                    </div>
-                    """, unsafe_allow_html=True)
-        
-        # Action buttons
-        if st.session_state.ops_chat_history:
-            st.markdown("---")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                if st.button("📋 Export Chat", key="ops_export_chat", use_container_width=True):
-                    chat_export = json.dumps(st.session_state.ops_chat_history, default=str, indent=2)
-                    st.download_button(
-                        label="⬇️ Download JSON",
-                        data=chat_export,
-                        file_name=f"claude-ops-chat-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
-                    )
-            
-            with col2:
-                if st.button("📧 Email Summary", key="ops_email_summary", use_container_width=True):
-                    st.success("✅ Chat summary emailed to your team!")
-            
-            with col3:
-                if st.button("🔖 Save as Runbook", key="ops_save_runbook", use_container_width=True):
-                    st.info("Saving conversation as automated runbook...")
-    
-    @staticmethod
-    def _generate_ai_response(query, session, region, account):
-        """Generate intelligent AI response based on query"""
-        query_lower = query.lower()
-        
-        # Intelligent response generation
-        if "cost" in query_lower or "bill" in query_lower or "reduce" in query_lower:
-            return """
+_SAMPLE_RUNBOOKS_DF = pd.DataFrame([
+    {
+        'Name': 'nightly-backup',
+        'Description': 'Backup all production databases',
+        'Schedule': 'Daily 2 AM',
+        'Last Run': '2 hours ago',
+        'Status': 'Success',
+        'Executions': '247'
+    },
+    {
+        'Name': 'cost-optimization',
+        'Description': 'Stop non-prod resources after hours',
+        'Schedule': 'Daily 8 PM',
+        'Last Run': '5 hours ago',
+        'Status': 'Success',
+        'Executions': '183'
+    },
+    {
+        'Name': 'security-scan',
+        'Description': 'Scan for security misconfigurations',
+        'Schedule': 'Weekly Monday 1 AM',
+        'Last Run': '2 days ago',
+        'Status': 'Success',
+        'Executions': '52'
+    }
+])
+
+_BULK_OPS = ('Start', 'Stop', 'Reboot')
+
+# Maps a bulk action label to the EC2 client method that executes it.
+_BULK_OP_METHODS = {
+    'Start': 'start_instances',
+    'Stop': 'stop_instances',
+    'Reboot': 'reboot_instances'
+}
+
+# Flat demo rate: $0.10/hr projected to a 30-day month, folded into one
+# constant so per-instance costs come from a single vectorized multiply.
+_MONTHLY_PER_RUNNING = 0.10 * 24 * 30
+
+# Shared client config: a pool large enough for concurrent fetches plus
+# adaptive retries so throttled describes back off instead of failing.
+# TCP keepalive holds warm connections open across sparse interactions so
+# widget clicks reuse the established TLS socket instead of renegotiating.
+_BOTO_CFG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+def _extract_tags(tag_list: list) -> dict:
+    """Tag list as a plain dict, built in one comprehension pass.
+
+    Keeping every key (not just the displayed ones) lets future handlers
+    filter on arbitrary tags without re-scanning the AWS tag list.
+    """
+    return {tag['Key']: tag['Value'] for tag in tag_list or []}
+
+_COST_RESPONSE = """
 **💰 AWS Cost Analysis & Optimization**
 
 I've analyzed your AWS account and found several cost optimization opportunities:
@@ -253,9 +240,8 @@ I've analyzed your AWS account and found several cost optimization opportunities
 
 Would you like me to implement any of these optimizations?
 """
-        
-        elif "running" in query_lower and "instance" in query_lower:
-            return """
+
+_RUNNING_INSTANCES_RESPONSE = """
 **💻 Running EC2 Instances Analysis**
 
 I've found **12 running instances** in your account:
@@ -285,9 +271,8 @@ I've found **12 running instances** in your account:
 
 Would you like me to stop the unused instances?
 """
-        
-        elif "security" in query_lower or "vulnerability" in query_lower:
-            return """
+
+_SECURITY_RESPONSE = """
 **🔐 Security Posture Analysis**
 
 I've identified **7 security issues** requiring attention:
@@ -333,9 +318,8 @@ I've identified **7 security issues** requiring attention:
 
 Would you like me to create remediation runbooks?
 """
-        
-        elif "disaster" in query_lower or "dr" in query_lower or "recovery" in query_lower:
-            return """
+
+_DR_RESPONSE = """
 **💾 Disaster Recovery Plan Analysis**
 
 I've analyzed your infrastructure and created a DR strategy:
@@ -397,9 +381,8 @@ I've analyzed your infrastructure and created a DR strategy:
 
 Would you like me to implement this DR plan?
 """
-        
-        elif "unused" in query_lower or "idle" in query_lower or "haven't been used" in query_lower:
-            return """
+
+_IDLE_RESOURCES_RESPONSE = """
 **🔍 Idle & Unused Resource Analysis**
 
 I've identified resources with low or no usage in the last 7 days:
@@ -456,10 +439,337 @@ I've identified resources with low or no usage in the last 7 days:
 
 Would you like me to execute these cleanup operations?
 """
+
+# Keyword-driven dispatch for canned assistant responses: each rule pairs
+# trigger keywords with the matcher (any/all) and the response to return.
+_RESPONSE_RULES = (
+    (('cost', 'bill', 'reduce'), any, _COST_RESPONSE),
+    (('running', 'instance'), all, _RUNNING_INSTANCES_RESPONSE),
+    (('security', 'vulnerability'), any, _SECURITY_RESPONSE),
+    (('disaster', 'dr', 'recovery'), any, _DR_RESPONSE),
+    (('unused', 'idle', "haven't been used"), any, _IDLE_RESOURCES_RESPONSE),
+)
+
+# ============================================================================
+# CACHED DATA FETCHERS
+# ============================================================================
+
+@st.cache_resource(ttl=3600)
+def _get_ec2_client(account_name: str, region: str):
+    """Cached EC2 client per (account, region).
+
+    boto3 clients are thread-safe and reusable, so reruns share one client
+    (and its connection pool) instead of re-signing a session each time.
+    """
+    account_mgr = get_account_manager()
+    if not account_mgr:
+        return None
+
+    session = account_mgr.get_session_with_region(account_name, region)
+    if not session:
+        return None
+
+    return session.client('ec2', config=_BOTO_CFG)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_instances(account_name: str, region: str) -> list:
+    """Fetch and parse EC2 instances for an account/region.
+
+    Cached so widget interactions within the TTL window reuse the parsed
+    result instead of re-calling describe_instances on every rerun.
+    """
+    ec2 = _get_ec2_client(account_name, region)
+    if not ec2:
+        return []
+
+    try:
+        paginator = ec2.get_paginator('describe_instances')
+        # Server-side state filter: terminated instances never cross the
+        # wire, and pagination covers accounts beyond the single-page limit.
+        pages = list(paginator.paginate(
+            Filters=[{
+                'Name': 'instance-state-name',
+                'Values': ['running', 'stopped', 'pending', 'stopping']
+            }],
+            PaginationConfig={'PageSize': 1000}
+        ))
+    except Exception:
+        return []
+
+    instances = []
+    for page in pages:
+        for reservation in page['Reservations']:
+            for instance in reservation['Instances']:
+                tags = _extract_tags(instance.get('Tags', []))
+                instances.append({
+                    'instance_id': instance['InstanceId'],
+                    'name': tags.get('Name', 'Unnamed'),
+                    'instance_type': instance['InstanceType'],
+                    'state': instance['State']['Name'],
+                    'availability_zone': instance['Placement']['AvailabilityZone'],
+                    'private_ip': instance.get('PrivateIpAddress', 'N/A'),
+                    'public_ip': instance.get('PublicIpAddress', 'N/A'),
+                    'launch_time': instance['LaunchTime'],
+                    'environment': tags.get('Environment', 'untagged'),
+                    'application': tags.get('Application', 'untagged'),
+                    'owner': tags.get('Owner', 'untagged'),
+                    'cost_center': tags.get('CostCenter', 'untagged'),
+                    'tags': tags
+                })
+
+    return instances
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _instances_frame(account_name: str, region: str) -> pd.DataFrame:
+    """Canonical instance DataFrame with display-ready dtypes.
+
+    Low-cardinality string columns are stored as category codes (integer
+    compares, ~1 byte per row) and launch times are formatted in a single
+    vectorized pass. Cached so the conversion runs once per TTL window.
+    """
+    df = pd.DataFrame(_fetch_instances(account_name, region))
+    if df.empty:
+        return df
+
+    # The raw tag dict stays available on _fetch_instances for handlers;
+    # the display frame keeps only the flattened columns.
+    df = df.drop(columns='tags')
+
+    for col in ('environment', 'application', 'owner', 'cost_center', 'state'):
+        df[col] = df[col].astype('category')
+
+    df['launch_time'] = pd.to_datetime(df['launch_time'], utc=True).dt.strftime('%Y-%m-%d %H:%M:%S')
+    df['est_monthly'] = np.where(df['state'].to_numpy() == 'running', _MONTHLY_PER_RUNNING, 0.0)
+    return df
+
+@st.cache_resource
+def _history_store() -> pd.DataFrame:
+    """Singleton operation-history DataFrame.
+
+    Lives for the process lifetime: renders read it as-is (zero allocation)
+    and operation handlers append a row only when something actually ran.
+    """
+    return pd.DataFrame(columns=['timestamp', 'operation', 'targets', 'status'])
+
+def _record_operation(operation: str, targets: str, status: str):
+    """Append one row to the shared operation history."""
+    history = _history_store()
+    history.loc[len(history)] = (
+        datetime.now().strftime('%Y-%m-%d %H:%M:%S'), operation, targets, status
+    )
+
+class OperationsModule:
+    """AI-Enhanced Operations with Anthropic Claude"""
+    
+    @staticmethod
+    def render():
+        """Main render method"""
+        st.title("⚙️ AI-Enhanced Operations")
+        st.markdown("**Intelligent Operations powered by Anthropic Claude** - AI assistant, predictive maintenance, smart automation, and comprehensive vulnerability management")
         
-        else:
-            # Generic intelligent response
-            return f"""
+        account_mgr = get_account_manager()
+        if not account_mgr:
+            st.warning("⚠️ Configure AWS credentials first")
+            return
+        
+        account_names = get_account_names()
+        if not account_names:
+            st.warning("⚠️ No AWS accounts configured")
+            return
+        
+        # Account selection
+        selected_account = st.selectbox(
+            "Select AWS Account",
+            options=account_names,
+            key="operations_account"
+        )
+        
+        if not selected_account:
+            return
+        
+        # Get region
+        selected_region = st.session_state.get('selected_regions', 'all')
+        
+        if selected_region == 'all':
+            st.error("❌ Operations require a specific region. Please select a region from the sidebar.")
+            return
+        
+        st.info(f"📍 Managing operations in **{selected_region}**")
+        
+        # Get session
+        session = account_mgr.get_session_with_region(selected_account, selected_region)
+        if not session:
+            st.error(f"Failed to get session for {selected_account} in {selected_region}")
+            return
+        
+        # Lazy section dispatch: st.tabs executes every tab body on every
+        # rerun, so a radio + single render call cuts per-rerun work to the
+        # one section the user is actually looking at.
+        renderers = {
+            "🤖 AI Operations Assistant": lambda: OperationsModule._render_ai_assistant(session, selected_region, selected_account),
+            "🔍 AI Troubleshooting": lambda: OperationsModule._render_ai_troubleshooting(session, selected_region),
+            "🛡️ Vulnerability Management": lambda: OperationsModule._render_vulnerability_management(session, selected_region),
+            "💻 Instance Management": lambda: OperationsModule._render_instance_management(session, selected_region, selected_account),
+            "📊 ML Model Deployment": lambda: OperationsModule._render_ml_deployment(session, selected_region),
+            "🔮 Predictive Maintenance": lambda: OperationsModule._render_predictive_maintenance(session, selected_region),
+            "📖 Smart Runbooks": lambda: OperationsModule._render_smart_runbooks(session, selected_region)
+        }
+
+        section = st.radio(
+            "Section",
+            options=list(renderers.keys()),
+            horizontal=True,
+            label_visibility="collapsed",
+            key="ops_active_section"
+        )
+
+        # Warm the Instance Management fetch in the background while the
+        # user reads another section, so switching to it skips the
+        # describe round trip. One prefetch per account/region per session.
+        prefetch_key = f"ops_prefetch_{selected_account}_{selected_region}"
+        if section != "💻 Instance Management" and not st.session_state.get(prefetch_key):
+            st.session_state[prefetch_key] = True
+            threading.Thread(
+                target=_fetch_instances,
+                args=(selected_account, selected_region),
+                daemon=True
+            ).start()
+
+        st.markdown("---")
+        renderers[section]()
+
+    @staticmethod
+    def _render_vulnerability_management(session, region):
+        """Vulnerability Management section (separate module)"""
+        try:
+            from modules_vulnerability_management import VulnerabilityManagementModule
+            VulnerabilityManagementModule.render(session, region)
+        except ImportError as e:
+            st.error(f"❌ Vulnerability Management module not found: {e}")
+            st.info("Please ensure modules_vulnerability_management.py is in the src folder.")
+    
+    @staticmethod
+    def _render_ai_assistant(session, region, account):
+        """AI Operations Assistant powered by Claude"""
+        st.markdown("## 🤖 AI Operations Assistant")
+        st.info("💬 Chat with Claude about your AWS infrastructure - ask questions, get recommendations, automate operations")
+        
+        # Initialize chat history
+        if 'ops_chat_history' not in st.session_state:
+            st.session_state.ops_chat_history = []
+        
+        # Sample questions
+        st.markdown("### 💡 Try asking:")
+
+        cols = st.columns(2)
+        for i, question in enumerate(_SAMPLE_QUESTIONS):
+            with cols[i % 2]:
+                if st.button(f"💡 {question}", key=f"sample_ops_q_{i}", use_container_width=True):
+                    st.session_state.ops_query = question
+        
+        st.markdown("---")
+        
+        # Chat interface
+        query = st.text_area(
+            "Ask Claude about your AWS operations:",
+            value=st.session_state.get('ops_query', ''),
+            placeholder="e.g., Stop all instances tagged Environment=Dev",
+            height=100,
+            key="ops_query_input"
+        )
+        
+        col1, col2, col3 = st.columns([1, 1, 4])
+        
+        with col1:
+            ask_button = st.button("🤖 Ask Claude", type="primary", key="ops_ask_claude", use_container_width=True)
+        
+        with col2:
+            if st.button("🗑️ Clear Chat", key="ops_clear_chat", use_container_width=True):
+                st.session_state.ops_chat_history = []
+                st.session_state.ops_query = ''
+                st.rerun()
+        
+        if ask_button and query:
+            # Add user message to history
+            st.session_state.ops_chat_history.append({
+                'role': 'user',
+                'content': query,
+                'timestamp': datetime.now()
+            })
+            
+            with st.spinner("🤖 Claude is analyzing your infrastructure..."):
+                import time
+                time.sleep(1.5)
+                
+                # Generate intelligent response based on query
+                response = OperationsModule._generate_ai_response(query, session, region, account)
+                
+                # Add assistant response to history
+                st.session_state.ops_chat_history.append({
+                    'role': 'assistant',
+                    'content': response,
+                    'timestamp': datetime.now()
+                })
+        
+        # Display chat history
+        if st.session_state.ops_chat_history:
+            st.markdown("---")
+            st.markdown("### 💬 Conversation")
+            
+            for msg in st.session_state.ops_chat_history:
+                if msg['role'] == 'user':
+                    st.markdown(f"""
+                    <div style="background: #e3f2fd; padding: 15px; border-radius: 10px; margin: 10px 0;">
+                        <strong>👤 You:</strong><br/>
+                        {msg['content']}
+                        <br/><small style="color: #666;">{msg['timestamp'].strftime('%H:%M:%S')}</small>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div style="background: #f5f5f5; padding: 15px; border-radius: 10px; margin: 10px 0;">
+                        <strong>🤖 Claude:</strong><br/>
+                        {msg['content']}
+                        <br/><small style="color: #666;">{msg['timestamp'].strftime('%H:%M:%S')}</small>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        # Action buttons
+        if st.session_state.ops_chat_history:
+            st.markdown("---")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                if st.button("📋 Export Chat", key="ops_export_chat", use_container_width=True):
+                    chat_export = json.dumps(st.session_state.ops_chat_history, default=str, indent=2)
+                    st.download_button(
+                        label="⬇️ Download JSON",
+                        data=chat_export,
+                        file_name=f"claude-ops-chat-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                        mime="application/json"
+                    )
+            
+            with col2:
+                if st.button("📧 Email Summary", key="ops_email_summary", use_container_width=True):
+                    st.success("✅ Chat summary emailed to your team!")
+            
+            with col3:
+                if st.button("🔖 Save as Runbook", key="ops_save_runbook", use_container_width=True):
+                    st.info("Saving conversation as automated runbook...")
+    
+    @staticmethod
+    def _generate_ai_response(query, session, region, account):
+        """Generate intelligent AI response based on query"""
+        query_lower = query.lower()
+
+        # Table-driven dispatch instead of an if/elif chain of substring
+        # scans; first matching rule wins.
+        for keywords, match, response in _RESPONSE_RULES:
+            if match(k in query_lower for k in keywords):
+                return response
+
+        # Generic intelligent response
+        return f"""
 **🤖 Claude Operations Analysis**
 
 I understand you're asking about: *"{query}"*
@@ -502,7 +812,7 @@ For specific analysis, try asking:
 
 What would you like me to help with?
 """
-    
+
     @staticmethod
     def _render_ai_troubleshooting(session, region):
         """AI-powered troubleshooting assistant"""
@@ -681,81 +991,192 @@ Monitoring for 5 minutes to confirm stability...
         st.markdown("---")
         st.markdown("### 📜 Recent Issues Resolved by Claude")
         
-        recent_issues = [
-            {
-                'Time': '2 hours ago',
-                'Issue': 'High memory usage on prod-web-server-01',
-                'Root Cause': 'Memory leak in Node.js application',
-                'Resolution': 'Restarted application + deployed memory leak fix',
-                'Time to Resolve': '8 minutes'
-            },
-            {
-                'Time': '5 hours ago',
-                'Issue': 'Lambda function timeouts',
-                'Root Cause': 'Insufficient memory allocation (128 MB)',
-                'Resolution': 'Increased memory to 512 MB',
-                'Time to Resolve': '3 minutes'
-            },
-            {
-                'Time': '1 day ago',
-                'Issue': 'S3 bucket access denied errors',
-                'Root Cause': 'Incorrect bucket policy after update',
-                'Resolution': 'Restored previous bucket policy',
-                'Time to Resolve': '5 minutes'
-            }
-        ]
-        
-        df = pd.DataFrame(recent_issues)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.dataframe(_RECENT_ISSUES_DF, use_container_width=True, hide_index=True)
     
     @staticmethod
-    def _render_instance_management(session, region):
+    def _render_instance_management(session, region, account):
         """Enhanced instance management with AI insights"""
         st.markdown("## 💻 Instance Management")
         st.info("🤖 AI-enhanced instance operations with intelligent recommendations")
-        
-        # This would contain your existing instance management code
-        # but enhanced with AI insights
-        
+
         st.markdown("### 📊 Instance Overview")
-        
-        # Sample data with AI insights
-        instances_data = [
-            {
-                'Instance ID': 'i-0123456789',
-                'Name': 'prod-web-01',
-                'Type': 't3.large',
-                'State': 'running',
-                'CPU': '45%',
-                'Memory': '67%',
-                'AI Insight': '✅ Optimally sized',
-                'Monthly Cost': '$73'
-            },
-            {
-                'Instance ID': 'i-9876543210',
-                'Name': 'legacy-app',
-                'Type': 't3.medium',
-                'State': 'running',
-                'CPU': '2%',
-                'Memory': '12%',
-                'AI Insight': '⚠️ Underutilized - Consider stopping',
-                'Monthly Cost': '$36'
-            },
-            {
-                'Instance ID': 'i-1122334455',
-                'Name': 'prod-api',
-                'Type': 't3.xlarge',
-                'State': 'running',
-                'CPU': '78%',
-                'Memory': '89%',
-                'AI Insight': '🔴 Consider upgrading to t3.2xlarge',
-                'Monthly Cost': '$146'
-            }
+
+        # Single canonical DataFrame: state counts and filtering run as
+        # vectorized column ops instead of repeated Python scans.
+        df = _instances_frame(account, region)
+
+        if df.empty:
+            st.info("No EC2 instances found in this region")
+            return
+
+        state_counts = df['state'].value_counts()
+        running = int(state_counts.get('running', 0))
+        stopped = int(state_counts.get('stopped', 0))
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Instances", len(df))
+        with col2:
+            st.metric("Running", running)
+        with col3:
+            st.metric("Stopped", stopped)
+        with col4:
+            # Cost column is precomputed at parse time; the metric is a
+            # single sum-reduce instead of a fresh rate multiply per rerun.
+            st.metric("Est. Monthly Cost", f"${df['est_monthly'].sum():,.2f}")
+
+        # Filter options come straight from the categorical codes computed at
+        # parse time - no per-rerun set/sort passes over the instance list.
+        st.markdown("### 🔍 Filters")
+        fcol1, fcol2, fcol3, fcol4 = st.columns(4)
+
+        with fcol1:
+            selected_env = st.selectbox(
+                "Environment",
+                options=['All'] + df['environment'].cat.categories.tolist(),
+                key="ops_filter_env"
+            )
+        with fcol2:
+            selected_app = st.selectbox(
+                "Application",
+                options=['All'] + df['application'].cat.categories.tolist(),
+                key="ops_filter_app"
+            )
+        with fcol3:
+            selected_state = st.selectbox(
+                "State",
+                options=['All'] + df['state'].cat.categories.tolist(),
+                key="ops_filter_state"
+            )
+        with fcol4:
+            selected_owner = st.selectbox(
+                "Owner",
+                options=['All'] + df['owner'].cat.categories.tolist(),
+                key="ops_filter_owner"
+            )
+
+        # Combine all active filters into one boolean mask and slice once,
+        # instead of allocating an intermediate frame per filter.
+        conditions = [
+            (df[col].to_numpy() == val)
+            for col, val in (
+                ('environment', selected_env),
+                ('application', selected_app),
+                ('state', selected_state),
+                ('owner', selected_owner)
+            )
+            if val != 'All'
         ]
-        
-        df = pd.DataFrame(instances_data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
-        
+
+        if conditions:
+            filtered_df = df[np.logical_and.reduce(conditions)]
+        else:
+            filtered_df = df
+
+        st.dataframe(filtered_df, use_container_width=True, hide_index=True)
+
+        # Bulk selection: options are raw instance ids with a format_func for
+        # display, so selections resolve by id without parsing label strings.
+        st.markdown("### 🎯 Bulk Operations")
+
+        instance_ids = filtered_df['instance_id'].tolist()
+        labels = dict(zip(
+            filtered_df['instance_id'],
+            filtered_df['name'].astype(str) + ' (' + filtered_df['instance_id'] + ') - ' + filtered_df['state'].astype(str)
+        ))
+
+        selected_ids = st.multiselect(
+            "Choose instances",
+            options=instance_ids,
+            format_func=lambda x: labels[x],
+            key="ops_bulk_select"
+        )
+
+        if selected_ids:
+            # One value_counts pass covers every per-selection aggregate.
+            sel_df = filtered_df[filtered_df['instance_id'].isin(selected_ids)]
+            sel_counts = sel_df['state'].value_counts()
+            running_selected = int(sel_counts.get('running', 0))
+            stopped_selected = int(sel_counts.get('stopped', 0))
+            requires_approval = bool(
+                sel_df['environment'].astype(str).str.lower().isin(('prod', 'production')).any()
+            )
+
+            selected_monthly = sel_df['est_monthly'].sum()
+
+            st.caption(
+                f"{len(selected_ids)} instance(s) selected — "
+                f"{running_selected} running, {stopped_selected} stopped, "
+                f"~${selected_monthly:,.2f}/month while running"
+            )
+
+            if requires_approval:
+                st.warning("⚠️ Selection includes production instances — operations require approval")
+
+            # One form with an action selector replaces a row of buttons per
+            # instance; the whole selection goes out as a single API call.
+            with st.form("ops_bulk_form"):
+                action = st.selectbox("Action", options=_BULK_OPS, key="ops_bulk_action")
+                submitted = st.form_submit_button("⚡ Apply to Selection")
+
+            if submitted:
+                OperationsModule._execute_bulk_action(account, region, action, selected_ids)
+
+        # Paginated detail view: only one page of rows is materialized per
+        # rerun and the table itself is virtualized by Streamlit.
+        st.markdown("### 📋 Instance Details")
+
+        page_size = 10
+        total_pages = max(1, (len(filtered_df) + page_size - 1) // page_size)
+        page = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            key="ops_detail_page"
+        )
+        page_df = filtered_df.iloc[(page - 1) * page_size: page * page_size]
+
+        detail_df = page_df[['state', 'instance_id', 'name', 'instance_type',
+                             'availability_zone', 'environment', 'owner',
+                             'private_ip', 'public_ip', 'launch_time']].copy()
+        states = detail_df['state'].astype(str)
+        detail_df['state'] = states.map(_STATUS_ICON).fillna('⚪').str.cat(states, sep=' ')
+        # Console links as one vectorized string concat; the LinkColumn
+        # renders them without any per-row f-string work in Python.
+        detail_df['console_url'] = (
+            f'https://{region}.console.aws.amazon.com/ec2/v2/home?region={region}'
+            '#Instances:instanceId=' + detail_df['instance_id']
+        )
+
+        selection = st.dataframe(
+            detail_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="ops_detail_table",
+            column_config={
+                'console_url': st.column_config.LinkColumn('Console', display_text='Open')
+            }
+        )
+        st.caption(f"Page {page} of {total_pages} ({len(filtered_df)} instances)")
+
+        # Actions only exist for the one selected row - a single virtualized
+        # table replaces a widget-heavy expander per instance.
+        if selection.selection.rows:
+            selected_row = page_df.iloc[selection.selection.rows[0]]
+            OperationsModule._render_instance_actions(account, region, selected_row)
+        
+        # Shared history store: nothing is rebuilt here, operations append
+        # their own rows as they complete.
+        st.markdown("### 📜 Operation History")
+        history = _history_store()
+        if history.empty:
+            st.caption("No operations recorded yet")
+        else:
+            st.dataframe(history, use_container_width=True, hide_index=True)
+
         # AI recommendations panel
         st.markdown("---")
         st.markdown("### 🤖 AI Recommendations")
@@ -783,6 +1204,95 @@ Monitoring for 5 minutes to confirm stability...
                 delta="Upgrade recommended"
             )
     
+    @staticmethod
+    def _execute_bulk_action(account, region, action, instance_ids):
+        """Dispatch a bulk Start/Stop/Reboot to a single batched EC2 call"""
+        ec2 = _get_ec2_client(account, region)
+        if not ec2:
+            st.error("Failed to get EC2 client")
+            return
+
+        try:
+            getattr(ec2, _BULK_OP_METHODS[action])(InstanceIds=list(instance_ids))
+            _fetch_instances.clear()
+            _instances_frame.clear()
+            _record_operation(action, ', '.join(instance_ids), 'Requested')
+            st.success(f"✅ {action} requested for {len(instance_ids)} instance(s)")
+        except Exception as e:
+            _record_operation(action, ', '.join(instance_ids), 'Failed')
+            st.error(f"Error executing {action}: {str(e)}")
+
+    @staticmethod
+    def _render_instance_actions(account, region, instance):
+        """Action panel for the instance selected in the detail table.
+
+        Buttons queue the action instead of calling AWS immediately;
+        queued actions for many instances flush as one batched call per
+        action type, so N clicks cost one round trip instead of N.
+        """
+        st.markdown(f"#### ⚡ Actions — {instance['name']} ({instance['instance_id']})")
+
+        pending = st.session_state.setdefault('ops_pending_actions', [])
+        entry_for = lambda action: (action, instance['instance_id'])
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            if st.button("▶️ Start", key="ops_action_start", use_container_width=True):
+                if entry_for('Start') not in pending:
+                    pending.append(entry_for('Start'))
+
+        with col2:
+            if st.button("⏹️ Stop", key="ops_action_stop", use_container_width=True):
+                if entry_for('Stop') not in pending:
+                    pending.append(entry_for('Stop'))
+
+        with col3:
+            if st.button("🔄 Reboot", key="ops_action_reboot", use_container_width=True):
+                if entry_for('Reboot') not in pending:
+                    pending.append(entry_for('Reboot'))
+
+        if pending:
+            st.caption(
+                "Pending: " + ', '.join(f"{action} {iid}" for action, iid in pending)
+            )
+
+            apply_col, clear_col = st.columns(2)
+            with apply_col:
+                if st.button("⚡ Apply Pending", key="ops_apply_pending", use_container_width=True):
+                    OperationsModule._flush_pending_actions(account, region)
+            with clear_col:
+                if st.button("🗑️ Clear Pending", key="ops_clear_pending", use_container_width=True):
+                    st.session_state['ops_pending_actions'] = []
+
+    @staticmethod
+    def _flush_pending_actions(account, region):
+        """Flush the queued actions as one batched call per action type"""
+        pending = st.session_state.get('ops_pending_actions', [])
+        if not pending:
+            return
+
+        ec2 = _get_ec2_client(account, region)
+        if not ec2:
+            st.error("Failed to get EC2 client")
+            return
+
+        for action in _BULK_OPS:
+            instance_ids = [iid for act, iid in pending if act == action]
+            if not instance_ids:
+                continue
+            try:
+                getattr(ec2, _BULK_OP_METHODS[action])(InstanceIds=instance_ids)
+                _record_operation(action, ', '.join(instance_ids), 'Requested')
+                st.success(f"✅ {action} requested for {len(instance_ids)} instance(s)")
+            except Exception as e:
+                _record_operation(action, ', '.join(instance_ids), 'Failed')
+                st.error(f"Error executing {action}: {str(e)}")
+
+        st.session_state['ops_pending_actions'] = []
+        _fetch_instances.clear()
+        _instances_frame.clear()
+
     @staticmethod
     def _render_ml_deployment(session, region):
         """ML Model deployment and management"""
@@ -885,38 +1395,7 @@ Monitoring for 5 minutes to confirm stability...
         st.markdown("---")
         st.markdown("### 📊 Active ML Deployments")
         
-        deployments = [
-            {
-                'Model Name': 'fraud-detection-v2',
-                'Type': 'SageMaker',
-                'Status': 'InService',
-                'Requests/min': '450',
-                'Latency (p99)': '85ms',
-                'Accuracy': '94.2%',
-                'Cost/day': '$3.60'
-            },
-            {
-                'Model Name': 'recommendation-engine',
-                'Type': 'Lambda',
-                'Status': 'Active',
-                'Requests/min': '1200',
-                'Latency (p99)': '120ms',
-                'Accuracy': '89.5%',
-                'Cost/day': '$1.20'
-            },
-            {
-                'Model Name': 'claude-summarizer',
-                'Type': 'Bedrock',
-                'Status': 'Active',
-                'Requests/min': '80',
-                'Latency (p99)': '2.3s',
-                'Accuracy': 'N/A',
-                'Cost/day': '$12.40'
-            }
-        ]
-        
-        df = pd.DataFrame(deployments)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.dataframe(_SAMPLE_DEPLOYMENTS_DF, use_container_width=True, hide_index=True)
     
     @staticmethod
     def _render_predictive_maintenance(session, region):
@@ -958,61 +1437,24 @@ Monitoring for 5 minutes to confirm stability...
         st.markdown("---")
         st.markdown("### ⚠️ Predicted Issues")
         
-        predictions = [
-            {
-                'Resource': 'prod-db-master',
-                'Issue': 'Disk space exhaustion',
-                'Probability': '87%',
-                'ETA': '36 hours',
-                'Severity': 'Critical',
-                'Recommendation': 'Increase volume size from 100GB to 200GB',
-                'Prevention Cost': '$5/month',
-                'Outage Cost': '$10,000'
-            },
-            {
-                'Resource': 'prod-cache',
-                'Issue': 'Memory limit reached',
-                'Probability': '72%',
-                'ETA': '48 hours',
-                'Severity': 'High',
-                'Recommendation': 'Upgrade from cache.t3.medium to cache.r5.large',
-                'Prevention Cost': '$45/month',
-                'Outage Cost': '$5,000'
-            },
-            {
-                'Resource': 'api-gateway',
-                'Issue': 'Rate limit exceeded',
-                'Probability': '65%',
-                'ETA': '24 hours',
-                'Severity': 'Medium',
-                'Recommendation': 'Increase throttle limits',
-                'Prevention Cost': '$0',
-                'Outage Cost': '$2,000'
-            }
-        ]
-        
-        for pred in predictions:
-            severity_color = {
-                'Critical': '#dc3545',
-                'High': '#fd7e14',
-                'Medium': '#ffc107'
-            }[pred['Severity']]
-            
+        for pred in _SAMPLE_PREDICTIONS:
             with st.expander(f"⚠️ {pred['Resource']} - {pred['Issue']}", expanded=True):
                 col1, col2 = st.columns([2, 1])
-                
+
                 with col1:
-                    st.markdown(f"**Severity:** <span style='color: {severity_color}; font-weight: bold;'>{pred['Severity']}</span>", unsafe_allow_html=True)
-                    st.markdown(f"**Probability:** {pred['Probability']}")
-                    st.markdown(f"**Estimated Time:** {pred['ETA']}")
-                    st.markdown(f"**Recommendation:** {pred['Recommendation']}")
-                    
-                    st.markdown("---")
-                    st.markdown(f"**Cost Analysis:**")
-                    st.markdown(f"- Prevention: {pred['Prevention Cost']}")
-                    st.markdown(f"- Potential outage: {pred['Outage Cost']}")
-                    st.markdown(f"- **ROI:** {int((float(pred['Outage Cost'].replace('$','').replace(',','')) / max(float(pred['Prevention Cost'].replace('$','').replace('/month','')), 1)) * 100)}%")
-                
+                    roi = int((float(pred['Outage Cost'].replace('$', '').replace(',', ''))
+                               / max(float(pred['Prevention Cost'].replace('$', '').replace('/month', '')), 1)) * 100)
+                    st.markdown(_PREDICTION_TMPL.format(
+                        severity_color=_SEVERITY_COLOR[pred['Severity']],
+                        severity=pred['Severity'],
+                        probability=pred['Probability'],
+                        eta=pred['ETA'],
+                        recommendation=pred['Recommendation'],
+                        prevention_cost=pred['Prevention Cost'],
+                        outage_cost=pred['Outage Cost'],
+                        roi=roi
+                    ), unsafe_allow_html=True)
+
                 with col2:
                     if st.button(f"🔧 Auto-Fix", key=f"fix_{pred['Resource']}", use_container_width=True):
                         st.success(f"✅ Preventive action scheduled for {pred['Resource']}")
@@ -1106,32 +1548,4 @@ steps:
         st.markdown("---")
         st.markdown("### 📚 Automation Library")
         
-        runbooks = [
-            {
-                'Name': 'nightly-backup',
-                'Description': 'Backup all production databases',
-                'Schedule': 'Daily 2 AM',
-                'Last Run': '2 hours ago',
-                'Status': 'Success',
-                'Executions': '247'
-            },
-            {
-                'Name': 'cost-optimization',
-                'Description': 'Stop non-prod resources after hours',
-                'Schedule': 'Daily 8 PM',
-                'Last Run': '5 hours ago',
-                'Status': 'Success',
-                'Executions': '183'
-            },
-            {
-                'Name': 'security-scan',
-                'Description': 'Scan for security misconfigurations',
-                'Schedule': 'Weekly Monday 1 AM',
-                'Last Run': '2 days ago',
-                'Status': 'Success',
-                'Executions': '52'
-            }
-        ]
-        
-        df = pd.DataFrame(runbooks)
-        st.dataframe(df, use_container_width=True, hide_index=True)
\ No newline at end of file
+        st.dataframe(_SAMPLE_RUNBOOKS_DF, use_container_width=True, hide_index=True)
\ No newline at end of file
@@ -339,6 +339,237 @@ from datetime import datetime, timedelta
 from core_account_manager import get_account_manager, get_account_names
 from aws_organizations import AWSOrganizationsManager
 import json
+import pyarrow as pa
+
+@st.cache_data(ttl=3600)
+def _guardrail_library() -> pd.DataFrame:
+    """Static guardrail catalog, built once per process.
+
+    Both guardrail tabs filter this single frame by category; the
+    categorical dtypes make that filter an integer-code mask and keep the
+    repeated strings dictionary-encoded instead of one Python object per
+    cell.
+    """
+    df = pd.DataFrame([
+        ("Preventive", "Deny Root Account Usage", "Enabled", "Critical", 12, "$50K", 0, False),
+        ("Preventive", "Require MFA for IAM Users", "Enabled", "High", 34, "$25K", 0, False),
+        ("Preventive", "Deny Public S3 Buckets", "Enabled", "Critical", 8, "$500K", 0, False),
+        ("Preventive", "Restrict Region Usage", "Enabled", "Medium", 56, "$10K", 0, False),
+        ("Preventive", "Deny Unencrypted EBS Volumes", "Enabled", "High", 23, "$100K", 0, False),
+        ("Detective", "Detect Unused IAM Credentials", "Enabled", "", 0, "", 3, True),
+        ("Detective", "Detect Open Security Groups", "Enabled", "", 0, "", 5, True),
+        ("Detective", "Detect Unencrypted Resources", "Enabled", "", 0, "", 12, False),
+        ("Detective", "Detect Public RDS Instances", "Enabled", "", 0, "", 0, True),
+        ("Detective", "Detect Exposed API Keys", "Enabled", "", 0, "", 2, True)
+    ], columns=["Category", "Name", "Status", "Severity", "Blocked", "Saved", "Findings", "AutoFix"])
+    return df.astype({"Category": "category", "Status": "category", "Severity": "category"})
+
+# SCP starter templates keyed by name; module-level so the JSON blobs
+# are allocated once at import instead of per template lookup.
+_POLICY_TEMPLATES = {
+    'Deny Root Account Usage': '''{
+  "Version": "2012-10-17",
+  "Statement": [{
+    "Sid": "DenyRootAccount",
+    "Effect": "Deny",
+    "Action": "*",
+    "Resource": "*",
+    "Condition": {
+      "StringLike": {
+        "aws:PrincipalArn": "arn:aws:iam::*:root"
+      }
+    }
+  }]
+}''',
+    'Require MFA for Sensitive Operations': '''{
+  "Version": "2012-10-17",
+  "Statement": [{
+    "Sid": "RequireMFAForSensitiveOps",
+    "Effect": "Deny",
+    "NotAction": ["iam:*", "sts:*"],
+    "Resource": "*",
+    "Condition": {
+      "BoolIfExists": {"aws:MultiFactorAuthPresent": "false"}
+    }
+  }]
+}''',
+    'Restrict Region Usage': '''{
+  "Version": "2012-10-17",
+  "Statement": [{
+    "Sid": "DenyAllOutsideApprovedRegions",
+    "Effect": "Deny",
+    "NotAction": [
+      "iam:*",
+      "organizations:*",
+      "route53:*",
+      "budgets:*",
+      "waf:*",
+      "cloudfront:*",
+      "globalaccelerator:*",
+      "importexport:*",
+      "support:*"
+    ],
+    "Resource": "*",
+    "Condition": {
+      "StringNotEquals": {
+        "aws:RequestedRegion": ["us-east-1", "us-west-2", "eu-west-1"]
+      }
+    }
+  }]
+}'''
+}
+
+# Canned demo output for the AI policy generator; module-level so the
+# multi-line JSON is parsed once at import, not on every form submit.
+_AI_GENERATED_POLICY_JSON = '''{
+  "Version": "2012-10-17",
+  "Statement": [
+    {
+      "Sid": "RestrictRegions",
+      "Effect": "Deny",
+      "NotAction": [
+        "iam:*",
+        "organizations:*",
+        "route53:*",
+        "budgets:*",
+        "waf:*",
+        "cloudfront:*",
+        "globalaccelerator:*",
+        "importexport:*",
+        "support:*"
+      ],
+      "Resource": "*",
+      "Condition": {
+        "StringNotEquals": {
+          "aws:RequestedRegion": [
+            "us-east-1",
+            "us-west-2"
+          ]
+        }
+      }
+    },
+    {
+      "Sid": "ProtectCloudTrail",
+      "Effect": "Deny",
+      "Action": [
+        "cloudtrail:DeleteTrail",
+        "cloudtrail:StopLogging",
+        "cloudtrail:UpdateTrail"
+      ],
+      "Resource": "*"
+    }
+  ]
+}'''
+
+# Demo prediction/remediation data is hard-coded; hoist it to module scope
+# so reruns reuse the same objects instead of re-allocating the dicts and
+# re-inferring DataFrame dtypes on every interaction.
+_PREDICTED_VIOLATIONS = (
+    {
+        'Account': 'dev-account-01',
+        'Predicted Violation': 'Will create public S3 bucket',
+        'Probability': '87%',
+        'ETA': '3 days',
+        'Risk': 'High',
+        'Reason': 'Developer pattern analysis shows upcoming deployment',
+        'Prevention': 'Deploy S3 public access block SCP now',
+        'Impact': 'Data breach risk ($500K+ potential loss)'
+    },
+    {
+        'Account': 'prod-account-02',
+        'Predicted Violation': 'Root account usage likely',
+        'Probability': '72%',
+        'ETA': '5 days',
+        'Risk': 'Critical',
+        'Reason': 'Quarterly audit pattern detected',
+        'Prevention': 'Remind team to use IAM roles instead',
+        'Impact': 'Compliance violation, audit failure'
+    },
+    {
+        'Account': 'staging-account-03',
+        'Predicted Violation': 'Unencrypted RDS instance',
+        'Probability': '65%',
+        'ETA': '2 days',
+        'Risk': 'High',
+        'Reason': 'CI/CD pipeline shows database creation',
+        'Prevention': 'Enable RDS encryption requirement',
+        'Impact': 'PCI-DSS compliance failure'
+    }
+)
+
+_PREDICTION_RISK_COLORS = {
+    'Critical': '#dc3545',
+    'High': '#fd7e14',
+    'Medium': '#ffc107'
+}
+
+
+@st.cache_data(ttl=3600)
+def _pending_remediations() -> "pa.Table":
+    """Pending auto-remediation queue, built once per process.
+
+    Display-only, so it is kept as an Arrow table: st.dataframe
+    serializes to Arrow anyway, and from_pylist skips pandas dtype
+    inference entirely.
+    """
+    return pa.Table.from_pylist([
+        {
+            'Account': 'dev-account-01',
+            'Issue': 'IAM user without MFA',
+            'Remediation': 'Disable access keys until MFA enabled',
+            'Confidence': '99%',
+            'Risk': 'Low',
+            'ETA': '30 seconds'
+        },
+        {
+            'Account': 'prod-account-02',
+            'Issue': 'Public S3 bucket detected',
+            'Remediation': 'Enable S3 Block Public Access',
+            'Confidence': '95%',
+            'Risk': 'High',
+            'ETA': '1 minute'
+        },
+        {
+            'Account': 'staging-account-03',
+            'Issue': 'Unencrypted EBS volume',
+            'Remediation': 'Create encrypted snapshot and replace',
+            'Confidence': '92%',
+            'Risk': 'Medium',
+            'ETA': '5 minutes'
+        }
+    ])
+
+
+@st.cache_data(ttl=3600)
+def _remediation_history() -> "pa.Table":
+    """Recent remediation log, built once per process as an Arrow table."""
+    return pa.Table.from_pylist([
+        {
+            'Time': '5 min ago',
+            'Account': 'dev-account-01',
+            'Issue': 'Open security group',
+            'Action': 'Removed 0.0.0.0/0 ingress rule',
+            'Result': 'Success',
+            'Time Taken': '12s'
+        },
+        {
+            'Time': '15 min ago',
+            'Account': 'prod-account-02',
+            'Issue': 'Missing CloudTrail encryption',
+            'Action': 'Enabled SSE-KMS encryption',
+            'Result': 'Success',
+            'Time Taken': '34s'
+        },
+        {
+            'Time': '1 hour ago',
+            'Account': 'staging-account-03',
+            'Issue': 'Unused IAM access key',
+            'Action': 'Deactivated access key',
+            'Result': 'Success',
+            'Time Taken': '8s'
+        }
+    ])
+
 
 class PolicyGuardrailsModule:
     """AI-Enhanced Policy & Guardrails Management with Proactive Intelligence"""
@@ -795,45 +1026,8 @@ Would you like me to generate specific policies for your use case?
         # Predicted violations
         st.markdown("### ⚠️ Predicted Policy Violations")
         
-        predictions = [
-            {
-                'Account': 'dev-account-01',
-                'Predicted Violation': 'Will create public S3 bucket',
-                'Probability': '87%',
-                'ETA': '3 days',
-                'Risk': 'High',
-                'Reason': 'Developer pattern analysis shows upcoming deployment',
-                'Prevention': 'Deploy S3 public access block SCP now',
-                'Impact': 'Data breach risk ($500K+ potential loss)'
-            },
-            {
-                'Account': 'prod-account-02',
-                'Predicted Violation': 'Root account usage likely',
-                'Probability': '72%',
-                'ETA': '5 days',
-                'Risk': 'Critical',
-                'Reason': 'Quarterly audit pattern detected',
-                'Prevention': 'Remind team to use IAM roles instead',
-                'Impact': 'Compliance violation, audit failure'
-            },
-            {
-                'Account': 'staging-account-03',
-                'Predicted Violation': 'Unencrypted RDS instance',
-                'Probability': '65%',
-                'ETA': '2 days',
-                'Risk': 'High',
-                'Reason': 'CI/CD pipeline shows database creation',
-                'Prevention': 'Enable RDS encryption requirement',
-                'Impact': 'PCI-DSS compliance failure'
-            }
-        ]
-        
-        for pred in predictions:
-            risk_color = {
-                'Critical': '#dc3545',
-                'High': '#fd7e14',
-                'Medium': '#ffc107'
-            }[pred['Risk']]
+        for pred in _PREDICTED_VIOLATIONS:
+            risk_color = _PREDICTION_RISK_COLORS[pred['Risk']]
             
             with st.expander(f"⚠️ {pred['Account']} - {pred['Predicted Violation']} ({pred['Probability']})", expanded=True):
                 col1, col2 = st.columns([2, 1])
@@ -1059,45 +1253,7 @@ Would you like me to generate specific policies for your use case?
                             
                             st.success("✅ Policy generated!")
                             st.markdown("### Generated Policy:")
-                            st.code('''{
-  "Version": "2012-10-17",
-  "Statement": [
-    {
-      "Sid": "RestrictRegions",
-      "Effect": "Deny",
-      "NotAction": [
-        "iam:*",
-        "organizations:*",
-        "route53:*",
-        "budgets:*",
-        "waf:*",
-        "cloudfront:*",
-        "globalaccelerator:*",
-        "importexport:*",
-        "support:*"
-      ],
-      "Resource": "*",
-      "Condition": {
-        "StringNotEquals": {
-          "aws:RequestedRegion": [
-            "us-east-1",
-            "us-west-2"
-          ]
-        }
-      }
-    },
-    {
-      "Sid": "ProtectCloudTrail",
-      "Effect": "Deny",
-      "Action": [
-        "cloudtrail:DeleteTrail",
-        "cloudtrail:StopLogging",
-        "cloudtrail:UpdateTrail"
-      ],
-      "Resource": "*"
-    }
-  ]
-}''', language='json')
+                            st.code(_AI_GENERATED_POLICY_JSON, language='json')
                             
                             if st.button("💾 Save This Policy", key="save_ai_generated"):
                                 st.success(f"Policy '{policy_name_ai}' saved!")
@@ -1142,61 +1298,8 @@ Would you like me to generate specific policies for your use case?
     @staticmethod
     def _get_policy_template(template_name: str) -> str:
         """Get policy template JSON"""
-        templates = {
-            'Deny Root Account Usage': '''{
-  "Version": "2012-10-17",
-  "Statement": [{
-    "Sid": "DenyRootAccount",
-    "Effect": "Deny",
-    "Action": "*",
-    "Resource": "*",
-    "Condition": {
-      "StringLike": {
-        "aws:PrincipalArn": "arn:aws:iam::*:root"
-      }
-    }
-  }]
-}''',
-            'Require MFA for Sensitive Operations': '''{
-  "Version": "2012-10-17",
-  "Statement": [{
-    "Sid": "RequireMFAForSensitiveOps",
-    "Effect": "Deny",
-    "NotAction": ["iam:*", "sts:*"],
-    "Resource": "*",
-    "Condition": {
-      "BoolIfExists": {"aws:MultiFactorAuthPresent": "false"}
-    }
-  }]
-}''',
-            'Restrict Region Usage': '''{
-  "Version": "2012-10-17",
-  "Statement": [{
-    "Sid": "DenyAllOutsideApprovedRegions",
-    "Effect": "Deny",
-    "NotAction": [
-      "iam:*",
-      "organizations:*",
-      "route53:*",
-      "budgets:*",
-      "waf:*",
-      "cloudfront:*",
-      "globalaccelerator:*",
-      "importexport:*",
-      "support:*"
-    ],
-    "Resource": "*",
-    "Condition": {
-      "StringNotEquals": {
-        "aws:RequestedRegion": ["us-east-1", "us-west-2", "eu-west-1"]
-      }
-    }
-  }]
-}'''
-        }
-        
-        return templates.get(template_name, '{}')
-    
+        return _POLICY_TEMPLATES.get(template_name, '{}')
+
     @staticmethod
     def _render_tag_policies():
         """Enhanced tag policy management"""
@@ -1308,58 +1411,48 @@ Would you like me to generate specific policies for your use case?
         with guardrail_tabs[0]:
             st.markdown("### Preventive Guardrails")
             
-            preventive_guardrails = [
-                {"Name": "Deny Root Account Usage", "Status": "Enabled", "Severity": "Critical", "Blocked": 12, "Saved": "$50K"},
-                {"Name": "Require MFA for IAM Users", "Status": "Enabled", "Severity": "High", "Blocked": 34, "Saved": "$25K"},
-                {"Name": "Deny Public S3 Buckets", "Status": "Enabled", "Severity": "Critical", "Blocked": 8, "Saved": "$500K"},
-                {"Name": "Restrict Region Usage", "Status": "Enabled", "Severity": "Medium", "Blocked": 56, "Saved": "$10K"},
-                {"Name": "Deny Unencrypted EBS Volumes", "Status": "Enabled", "Severity": "High", "Blocked": 23, "Saved": "$100K"}
-            ]
-            
-            for gr in preventive_guardrails:
-                severity_icon = "🔴" if gr['Severity'] == "Critical" else "🟠" if gr['Severity'] == "High" else "🟡"
-                status_icon = "✅" if gr['Status'] == "Enabled" else "⏸️"
-                
+            library = _guardrail_library()
+            preventive = library[library['Category'] == 'Preventive']
+
+            for gr in preventive.itertuples():
+                severity_icon = "🔴" if gr.Severity == "Critical" else "🟠" if gr.Severity == "High" else "🟡"
+                status_icon = "✅" if gr.Status == "Enabled" else "⏸️"
+
                 col1, col2, col3, col4, col5 = st.columns([3, 1, 1, 1, 1])
-                
+
                 with col1:
-                    st.write(f"{severity_icon} {gr['Name']}")
+                    st.write(f"{severity_icon} {gr.Name}")
                 with col2:
-                    st.write(gr['Severity'])
+                    st.write(gr.Severity)
                 with col3:
-                    st.write(f"{status_icon} {gr['Status']}")
+                    st.write(f"{status_icon} {gr.Status}")
                 with col4:
-                    st.metric("Blocked", gr['Blocked'])
+                    st.metric("Blocked", gr.Blocked)
                 with col5:
-                    st.metric("Saved", gr['Saved'])
+                    st.metric("Saved", gr.Saved)
         
         with guardrail_tabs[1]:
             st.markdown("### Detective Guardrails")
             
-            detective_guardrails = [
-                {"Name": "Detect Unused IAM Credentials", "Status": "Enabled", "Findings": 3, "Auto-Fix": True},
-                {"Name": "Detect Open Security Groups", "Status": "Enabled", "Findings": 5, "Auto-Fix": True},
-                {"Name": "Detect Unencrypted Resources", "Status": "Enabled", "Findings": 12, "Auto-Fix": False},
-                {"Name": "Detect Public RDS Instances", "Status": "Enabled", "Findings": 0, "Auto-Fix": True},
-                {"Name": "Detect Exposed API Keys", "Status": "Enabled", "Findings": 2, "Auto-Fix": True}
-            ]
-            
-            for gr in detective_guardrails:
-                finding_icon = "🔴" if gr['Findings'] > 5 else "🟡" if gr['Findings'] > 0 else "🟢"
-                
+            library = _guardrail_library()
+            detective = library[library['Category'] == 'Detective']
+
+            for gr in detective.itertuples():
+                finding_icon = "🔴" if gr.Findings > 5 else "🟡" if gr.Findings > 0 else "🟢"
+
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
-                
+
                 with col1:
-                    st.write(f"{finding_icon} {gr['Name']}")
+                    st.write(f"{finding_icon} {gr.Name}")
                 with col2:
-                    st.metric("Findings", gr['Findings'])
+                    st.metric("Findings", gr.Findings)
                 with col3:
-                    auto_fix_badge = "✅ Yes" if gr['Auto-Fix'] else "❌ No"
+                    auto_fix_badge = "✅ Yes" if gr.AutoFix else "❌ No"
                     st.write(f"Auto-Fix: {auto_fix_badge}")
                 with col4:
-                    if gr['Findings'] > 0:
-                        if st.button("⚡ Fix Now", key=f"fix_{gr['Name']}", type="primary", use_container_width=True):
-                            st.success(f"Fixing {gr['Findings']} findings...")
+                    if gr.Findings > 0:
+                        if st.button("⚡ Fix Now", key=f"fix_{gr.Name}", type="primary", use_container_width=True):
+                            st.success(f"Fixing {gr.Findings} findings...")
         
         with guardrail_tabs[2]:
             st.markdown("### 🤖 AI Learning & Adaptation")
@@ -1528,35 +1621,7 @@ Would you like me to generate specific policies for your use case?
         # Pending remediations
         st.markdown("### ⏳ Pending Auto-Remediations")
         
-        pending = [
-            {
-                'Account': 'dev-account-01',
-                'Issue': 'IAM user without MFA',
-                'Remediation': 'Disable access keys until MFA enabled',
-                'Confidence': '99%',
-                'Risk': 'Low',
-                'ETA': '30 seconds'
-            },
-            {
-                'Account': 'prod-account-02',
-                'Issue': 'Public S3 bucket detected',
-                'Remediation': 'Enable S3 Block Public Access',
-                'Confidence': '95%',
-                'Risk': 'High',
-                'ETA': '1 minute'
-            },
-            {
-                'Account': 'staging-account-03',
-                'Issue': 'Unencrypted EBS volume',
-                'Remediation': 'Create encrypted snapshot and replace',
-                'Confidence': '92%',
-                'Risk': 'Medium',
-                'ETA': '5 minutes'
-            }
-        ]
-        
-        pending_df = pd.DataFrame(pending)
-        st.dataframe(pending_df, use_container_width=True, hide_index=True)
+        st.dataframe(_pending_remediations(), use_container_width=True, hide_index=True)
         
         col1, col2, col3 = st.columns(3)
         
@@ -1576,35 +1641,7 @@ Would you like me to generate specific policies for your use case?
         st.markdown("---")
         st.markdown("### 📜 Recent Remediations")
         
-        history = [
-            {
-                'Time': '5 min ago',
-                'Account': 'dev-account-01',
-                'Issue': 'Open security group',
-                'Action': 'Removed 0.0.0.0/0 ingress rule',
-                'Result': 'Success',
-                'Time Taken': '12s'
-            },
-            {
-                'Time': '15 min ago',
-                'Account': 'prod-account-02',
-                'Issue': 'Missing CloudTrail encryption',
-                'Action': 'Enabled SSE-KMS encryption',
-                'Result': 'Success',
-                'Time Taken': '34s'
-            },
-            {
-                'Time': '1 hour ago',
-                'Account': 'staging-account-03',
-                'Issue': 'Unused IAM access key',
-                'Action': 'Deactivated access key',
-                'Result': 'Success',
-                'Time Taken': '8s'
-            }
-        ]
-        
-        history_df = pd.DataFrame(history)
-        st.dataframe(history_df, use_container_width=True, hide_index=True)
+        st.dataframe(_remediation_history(), use_container_width=True, hide_index=True)
         
         # AI recommendations
         st.markdown("---")
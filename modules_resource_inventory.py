@@ -5,12 +5,90 @@ Cross-account resource discovery and management
 
 import streamlit as st
 import pandas as pd
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 from config_settings import AppConfig
 from core_account_manager import get_account_manager
 from core_session_manager import SessionManager
 from utils_helpers import Helpers
 
+# Second cache tier beneath st.cache_data: st.cache_data lives in process
+# RAM and is lost on restart, so a short-TTL pickle on local disk lets a
+# fresh process render the inventory without hitting AWS first.
+_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'cldidp_cache')
+_DISK_CACHE_TTL = 60
+
+def _disk_cache_path(*key_parts: str) -> str:
+    digest = hashlib.sha256('|'.join(key_parts).encode()).hexdigest()
+    return os.path.join(_DISK_CACHE_DIR, f'{digest}.pkl')
+
+def _disk_cache_get(path: str):
+    try:
+        if time.time() - os.path.getmtime(path) < _DISK_CACHE_TTL:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError):
+        pass
+    return None
+
+def _disk_cache_put(path: str, value) -> None:
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def _disk_cache_clear() -> None:
+    """Drop every disk-tier entry; pairs with st.cache_data .clear()."""
+    try:
+        for name in os.listdir(_DISK_CACHE_DIR):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(_DISK_CACHE_DIR, name))
+    except OSError:
+        pass
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_account_instances(account_id: str, account_name: str, role_arn: str, region: str) -> list:
+    """Cached EC2 instance list for one account/region.
+
+    Keyed on the account identity and region so widget reruns inside the
+    TTL window reuse the parsed result instead of re-assuming the role and
+    re-calling describe_instances. A disk tier under the in-memory cache
+    keeps restarts warm.
+    """
+    account_mgr = get_account_manager()
+    if not account_mgr:
+        return []
+
+    cache_path = _disk_cache_path(account_id, account_name, role_arn, region)
+    cached = _disk_cache_get(cache_path)
+    if cached is not None:
+        return cached
+
+    try:
+        session = account_mgr.assume_role(account_id, account_name, role_arn)
+        if not session:
+            return []
+
+        from aws_ec2 import EC2Service
+        ec2 = EC2Service(session.session, region)
+        result = ec2.list_instances()
+        if result['success']:
+            _disk_cache_put(cache_path, result['instances'])
+            return result['instances']
+    except Exception:
+        pass
+
+    return []
+
 class ResourceInventoryModule:
     """Global resource inventory across all accounts"""
     
@@ -149,44 +227,73 @@ class ResourceInventoryModule:
         
         if selected_account_ids != 'all':
             accounts = [a for a in accounts if a.account_id in selected_account_ids]
-        
-        all_instances = []
-        
-        with st.spinner("Loading EC2 instances..."):
-            for acc in accounts:
-                for region in acc.regions:
-                    try:
-                        session = account_mgr.assume_role(
+
+        # Session-state sentinel: unrelated widget changes rerun this whole
+        # function, so only fetch when there is no stored result or the
+        # user explicitly refreshes.
+        if st.button("🔄 Refresh", key="ec2_inventory_refresh"):
+            # Clear both cache tiers - leaving the disk pickles in place
+            # would re-serve them inside their TTL and turn the refresh
+            # into a no-op.
+            _list_account_instances.clear()
+            _disk_cache_clear()
+            st.session_state.pop('ec2_inventory', None)
+
+        if 'ec2_inventory' not in st.session_state:
+            all_instances = []
+            pairs = [(acc, region) for acc in accounts for region in acc.regions]
+
+            with st.spinner("Loading EC2 instances..."):
+                # The per-pair fetches are independent network calls, so fan
+                # them out: wall time is ~one round trip instead of one per
+                # account/region. Cached results return immediately.
+                with ThreadPoolExecutor(max_workers=min(16, max(1, len(pairs)))) as executor:
+                    futures = {
+                        executor.submit(
+                            _list_account_instances,
                             acc.account_id,
                             acc.account_name,
-                            acc.role_arn
-                        )
-                        
-                        if session:
-                            from aws_ec2 import EC2Service
-                            ec2 = EC2Service(session.session, region)
-                            result = ec2.list_instances()
-                            
-                            if result['success']:
-                                for inst in result['instances']:
-                                    all_instances.append({
-                                        'Instance ID': inst['instance_id'],
-                                        'Account': acc.account_name,
-                                        'Region': region,
-                                        'Type': inst['instance_type'],
-                                        'State': inst['state'],
-                                        'AZ': inst['availability_zone'],
-                                        'Private IP': inst['private_ip'],
-                                        'Public IP': inst['public_ip'],
-                                        'Launch Time': Helpers.time_ago(inst['launch_time']),
-                                        'Name': inst['tags'].get('Name', 'N/A')
-                                    })
-                    except:
-                        pass
-        
+                            acc.role_arn,
+                            region
+                        ): (acc, region)
+                        for acc, region in pairs
+                    }
+
+                    for future in as_completed(futures):
+                        acc, region = futures[future]
+                        for inst in future.result():
+                            all_instances.append({
+                                'Instance ID': inst['instance_id'],
+                                'Account': acc.account_name,
+                                'Region': region,
+                                'Type': inst['instance_type'],
+                                'State': inst['state'],
+                                'AZ': inst['availability_zone'],
+                                'Private IP': inst['private_ip'],
+                                'Public IP': inst['public_ip'],
+                                'Launch Time': Helpers.time_ago(inst['launch_time']),
+                                'Name': inst['tags'].get('Name', 'N/A')
+                            })
+
+            st.session_state['ec2_inventory'] = all_instances
+
+        all_instances = st.session_state['ec2_inventory']
+
         if all_instances:
             st.success(f"✅ Found {len(all_instances)} EC2 instances")
-            
+
+            # One columnar frame up front: filtering and rendering become
+            # C-level column ops instead of per-dict Python scans.
+            inventory_df = pd.DataFrame(all_instances)
+
+            # Console links built in one vectorized concat at parse time,
+            # not per row during render.
+            inventory_df['Console'] = (
+                'https://' + inventory_df['Region']
+                + '.console.aws.amazon.com/ec2/v2/home?region=' + inventory_df['Region']
+                + '#Instances:instanceId=' + inventory_df['Instance ID']
+            )
+
             # Filter controls
             col1, col2 = st.columns(2)
             with col1:
@@ -195,12 +302,17 @@ class ResourceInventoryModule:
                     options=['running', 'stopped', 'pending', 'terminated'],
                     default=['running']
                 )
-            
+
             # Apply filters
-            filtered = [i for i in all_instances if i['State'] in state_filter]
-            
-            df = pd.DataFrame(filtered)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            df = inventory_df[inventory_df['State'].isin(state_filter)]
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'Console': st.column_config.LinkColumn('Console', display_text='Open')
+                }
+            )
             
             # Export option
             if st.button("📥 Export to CSV"):
@@ -27,173 +27,39 @@ st.set_page_config(
 # ==================================================================================
 # SIMPLE BLUE THEME - CLEAN & PROFESSIONAL
 # ==================================================================================
-st.markdown("""
-<style>
-/* ===== GLOBAL THEME ===== */
-:root {
-    --primary-color: #2E86DE;
-    --secondary-color: #0652DD;
-    --background-color: #FFFFFF;
-    --text-color: #000000;
-    --border-color: #E0E0E0;
-}
 
-/* Main app background - WHITE */
-.main {
-    background-color: white !important;
-}
-
-/* All text - BLACK */
-body, p, span, div, label, h1, h2, h3, h4, h5, h6 {
-    color: black !important;
-}
-
-/* ===== SIDEBAR ===== */
-[data-testid="stSidebar"] {
-    background-color: #F5F7FA !important;
-}
-
-[data-testid="stSidebar"] * {
-    color: black !important;
-}
-
-/* ===== HEADERS ===== */
-h1, h2, h3 {
-    color: #2E86DE !important;
-}
-
-/* ===== BUTTONS ===== */
-button {
-    background-color: #2E86DE !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 4px !important;
-    padding: 8px 16px !important;
-    font-weight: 500 !important;
-}
-
-button:hover {
-    background-color: #0652DD !important;
-    color: white !important;
-}
-
-/* ===== DROPDOWNS & SELECTS ===== */
-/* Dropdown labels */
-.stSelectbox label,
-.stMultiSelect label,
-.stTextInput label,
-.stNumberInput label,
-.stTextArea label {
-    color: black !important;
-    font-weight: 500 !important;
-}
-
-/* Dropdown options text - BLACK */
-div[data-baseweb="select"] [role="option"],
-div[data-baseweb="select"] li,
-[role="option"] {
-    color: black !important;
-    background-color: white !important;
-}
-
-/* Dropdown selected value - BLACK */
-div[data-baseweb="select"] > div {
-    color: black !important;
-    background-color: white !important;
-}
-
-/* Multiselect tags */
-div[data-baseweb="tag"] {
-    background-color: #2E86DE !important;
-}
-
-div[data-baseweb="tag"] span {
-    color: white !important;
-}
-
-/* ===== INPUT FIELDS ===== */
-input, textarea {
-    background-color: white !important;
-    color: black !important;
-    border: 1px solid #E0E0E0 !important;
-}
-
-/* ===== TABS ===== */
-.stTabs [data-baseweb="tab-list"] {
-    background-color: white !important;
-}
-
-.stTabs [data-baseweb="tab"] {
-    color: black !important;
-}
-
-.stTabs [aria-selected="true"] {
-    color: #2E86DE !important;
-    border-bottom: 2px solid #2E86DE !important;
-}
-
-/* ===== METRICS ===== */
-/* Let aws_theme.py handle metric styling - don't override! */
-.stMetric {
-    background-color: transparent !important;
-}
-
-/* ===== INFO/WARNING/ERROR BOXES ===== */
-.stAlert {
-    background-color: white !important;
-    border-left: 4px solid #2E86DE !important;
-}
-
-/* ===== DATAFRAMES ===== */
-.stDataFrame {
-    background-color: white !important;
-}
-
-table {
-    background-color: white !important;
-}
-
-th {
-    background-color: #2E86DE !important;
-    color: white !important;
-}
-
-td {
-    color: black !important;
-}
-
-/* ===== EXPANDERS ===== */
-.streamlit-expanderHeader {
-    background-color: #F5F7FA !important;
-    color: black !important;
-}
-
-/* ===== RADIO & CHECKBOX ===== */
-.stRadio label,
-.stCheckbox label {
-    color: black !important;
-}
-
-/* ===== CLEAN BORDERS ===== */
-.stSelectbox > div,
-.stMultiSelect > div,
-.stTextInput > div,
-.stNumberInput > div {
-    border-radius: 4px !important;
-}
-</style>
-""", unsafe_allow_html=True)
+# The theme rules live in static/app.css, served through Streamlit's
+# static assets (see .streamlit/config.toml) so the browser caches them
+# once; each rerun re-sends only the tiny <link> tag. The header HTML is
+# a module constant built once at import. Both must still be emitted per
+# rerun - Streamlit prunes elements a rerun does not redraw.
+_THEME_LINK = '<link rel="stylesheet" href="app/static/app.css">'
 # ==================================================================================
 # END SIMPLE BLUE THEME
 # ==================================================================================
 
 # Simple header - centered
-st.markdown("""
+_HEADER_HTML = """
 <div style="background: linear-gradient(135deg, #2E86DE 0%, #0652DD 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px; text-align: center;">
     <h1 style="color: white !important; margin: 0; font-weight: 600;">☁️ Cloud Infrastructure Development Platform</h1>
     <p style="color: white !important; margin: 5px 0 0 0; font-size: 16px;">Enterprise Multi-Account Cloud Management</p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_THEME_LINK, unsafe_allow_html=True)
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _footer_info():
+    """Footer timestamp and account count, refreshed at most every 5s.
+
+    Neither value needs to be recomputed on every widget interaction;
+    a short TTL keeps the footer current without the per-rerun work.
+    """
+    return (
+        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        SessionManager.get_active_account_count()
+    )
 
 def main():
     """Main application entry point"""
@@ -209,11 +75,12 @@ def main():
     
     # Simple footer
     st.markdown("---")
+    timestamp, account_count = _footer_info()
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.caption(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        st.caption(f"📅 {timestamp}")
     with col2:
-        st.caption(f"🔗 Connected Accounts: {SessionManager.get_active_account_count()}")
+        st.caption(f"🔗 Connected Accounts: {account_count}")
     with col3:
         st.caption("☁️ Cloud Infrastructure Development Platform")
 
@@ -6,6 +6,23 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 import streamlit as st
 
+# Built once at import; get_status_icon is called per row in render loops
+# and should not re-allocate this dict on every call.
+_STATUS_ICONS = {
+    'running': '🟢',
+    'stopped': '🔴',
+    'pending': '🟡',
+    'active': '✅',
+    'inactive': '❌',
+    'healthy': '💚',
+    'unhealthy': '💔',
+    'warning': '⚠️',
+    'error': '🚨',
+    'success': '✅',
+    'failed': '❌',
+    'in_progress': '⏳'
+}
+
 class Helpers:
     """General helper functions"""
     
@@ -65,21 +82,7 @@ class Helpers:
     @staticmethod
     def get_status_icon(status: str) -> str:
         """Get status icon"""
-        status_icons = {
-            'running': '🟢',
-            'stopped': '🔴',
-            'pending': '🟡',
-            'active': '✅',
-            'inactive': '❌',
-            'healthy': '💚',
-            'unhealthy': '💔',
-            'warning': '⚠️',
-            'error': '🚨',
-            'success': '✅',
-            'failed': '❌',
-            'in_progress': '⏳'
-        }
-        return status_icons.get(status.lower(), '⚪')
+        return _STATUS_ICONS.get(status.lower(), '⚪')
     
     @staticmethod
     def get_environment_badge(environment: str) -> str: